@@ -1,8 +1,10 @@
 """SQLAlchemy database setup."""
+import asyncio
 import datetime
 import logging
 import shutil
 import sqlite3
+import threading
 from collections.abc import AsyncGenerator
 from os import PathLike
 from pathlib import Path
@@ -17,6 +19,8 @@ from spoolman.prometheus.metrics import filament_metrics, spool_metrics
 
 logger = logging.getLogger(__name__)
 
+_backup_lock = threading.Lock()
+
 
 def get_connection_url() -> URL:
     """Construct the connection URL for the database based on environment variables."""
@@ -94,7 +98,7 @@ class Database:
         logger.info("Backing up SQLite database to %s", target_path)
 
         def progress(_: int, remaining: int, total: int) -> None:
-            logger.info("Copied %d of %d pages.", total - remaining, total)
+            logger.debug("Copied %d of %d pages.", total - remaining, total)
 
         if self.connection_url.database == target_path:
             raise ValueError("Cannot backup database to itself.")
@@ -113,6 +117,8 @@ class Database:
     ) -> Optional[Path]:
         """Backup the database and rotate existing backups.
 
+        This is blocking, so call it via a worker thread. Concurrent calls are serialized.
+
         Args:
             backup_folder: The folder to store the backups in.
             num_backups: The number of backups to keep.
@@ -125,29 +131,32 @@ class Database:
             return None
 
         backup_folder = Path(backup_folder)
-        backup_folder.mkdir(parents=True, exist_ok=True)
-
-        # Delete oldest backup
-        backup_path = backup_folder.joinpath(f"spoolman.db.{num_backups}")
-        if backup_path.exists():
-            logger.info("Deleting oldest backup %s", backup_path)
-            backup_path.unlink()
-
-        # Rotate existing backups
-        for i in range(num_backups - 1, -1, -1):
-            if i == 0:
-                backup_path = backup_folder.joinpath("spoolman.db")
-            else:
-                backup_path = backup_folder.joinpath(f"spoolman.db.{i}")
+
+        with _backup_lock:
+            backup_folder.mkdir(parents=True, exist_ok=True)
+
+            # Delete oldest backup
+            backup_path = backup_folder.joinpath(f"spoolman.db.{num_backups}")
             if backup_path.exists():
-                logger.debug("Rotating backup %s to %s", backup_path, backup_folder.joinpath(f"spoolman.db.{i + 1}"))
-                shutil.move(backup_path, backup_folder.joinpath(f"spoolman.db.{i + 1}"))
+                logger.info("Deleting oldest backup %s", backup_path)
+                backup_path.unlink()
+
+            # Rotate existing backups
+            for i in range(num_backups - 1, -1, -1):
+                if i == 0:
+                    backup_path = backup_folder.joinpath("spoolman.db")
+                else:
+                    backup_path = backup_folder.joinpath(f"spoolman.db.{i}")
+                if backup_path.exists():
+                    rotated_path = backup_folder.joinpath(f"spoolman.db.{i + 1}")
+                    logger.debug("Rotating backup %s to %s", backup_path, rotated_path)
+                    shutil.move(backup_path, rotated_path)
 
-        # Create new backup
-        backup_path = backup_folder.joinpath("spoolman.db")
-        self.backup(backup_path)
+            # Create new backup
+            backup_path = backup_folder.joinpath("spoolman.db")
+            self.backup(backup_path)
 
-        return backup_path
+            return backup_path
 
 
 __db: Optional[Database] = None
@@ -172,7 +181,7 @@ async def backup_global_db(num_backups: int = 5) -> Optional[Path]:
     """
     if __db is None:
         raise RuntimeError("DB is not setup.")
-    return __db.backup_and_rotate(env.get_backups_dir(), num_backups=num_backups)
+    return await asyncio.to_thread(__db.backup_and_rotate, env.get_backups_dir(), num_backups=num_backups)
 
 
 async def _backup_task() -> Optional[Path]:
@@ -180,7 +189,7 @@ async def _backup_task() -> Optional[Path]:
     logger.info("Performing scheduled database backup.")
     if __db is None:
         raise RuntimeError("DB is not setup.")
-    return __db.backup_and_rotate(env.get_backups_dir(), num_backups=5)
+    return await asyncio.to_thread(__db.backup_and_rotate, env.get_backups_dir(), num_backups=5)
 
 
 async def _metrics() -> None:
@@ -1,6 +1,9 @@
 """Integration tests for the Vendor API endpoint."""
 
+import asyncio
+
 import httpx
+import pytest
 
 from .conftest import URL, DbType, get_db_type
 
@@ -13,3 +16,22 @@ def test_backup():
     # Trigger backup
     result = httpx.post(f"{URL}/api/v1/backup")
     result.raise_for_status()
+
+
+@pytest.mark.asyncio()
+async def test_backup_concurrent():
+    """Test triggering several database backups at the same time."""
+    if get_db_type() != DbType.SQLITE:
+        return
+
+    # Trigger backups concurrently, rotation must not make any of them fail
+    async with httpx.AsyncClient(timeout=60) as client:
+        results = await asyncio.gather(*(client.post(f"{URL}/api/v1/backup") for _ in range(5)))
+
+    for result in results:
+        result.raise_for_status()
+
+    # Every backup should have been written to the same, newest rotation slot
+    paths = {result.json()["path"] for result in results}
+    assert len(paths) == 1
+    assert paths.pop().endswith("spoolman.db")